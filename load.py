@@ -1,28 +1,78 @@
 from __future__ import annotations
 
-import csv
 import datetime
 import json
 import logging
 import os
 import pathlib
-import re
 import tkinter as tk
+from functools import lru_cache
 from typing import Any, Dict, NotRequired, Optional, Required, Tuple, TypedDict
 
 from config import appname, config  # pyright: ignore[reportMissingImports]
 from theme import theme  # pyright: ignore[reportMissingImports]
 
+# orjson/msgspec parse bytes directly and are much faster, but aren't bundled
+# with EDMC. All of them return plain dicts/lists. This stays at module level:
+# load_json() runs on the first StartUp anyway, and deferring it would re-run
+# the failing imports on every call when neither package is installed.
+try:
+    from orjson import JSONDecodeError  # pyright: ignore[reportMissingImports]
+    from orjson import loads as json_loads  # pyright: ignore[reportMissingImports]
+except ImportError:
+    try:
+        from msgspec import DecodeError as JSONDecodeError  # pyright: ignore[reportMissingImports]
+        from msgspec.json import decode as json_loads  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        from json import JSONDecodeError
+        from json import loads as json_loads
+
 
 plugin_name = os.path.basename(os.path.dirname(__file__))
 logger = logging.getLogger(f"{appname}.{plugin_name}")
 
-CANONICALISE_RE = re.compile(r"\$(.+)_name;")
-
 # Track the list of rare commodity symbols ourselves, as there isn't metadata
 # readily available. But we have to load it from CSV at start.
 RARE_COMMODITY: set[str] = set()
 
+# The parsed rare commodities are cached across sessions, keyed by the CSV's
+# mtime and size, so we only re-parse when FDevIDs actually changes.
+RARE_COMMODITY_CACHE = ".rare_commodity.cache.pkl"
+
+# Fallback display names for unlocalised cargo, keyed by the raw cargo name
+_display_cache: dict[str, str] = {}
+
+# There is no Loadout for SRVs, so their cargo capacity is hardcoded.
+_SRV_CAPACITY: dict[str, int] = {"testbuggy": 4, "combat_multicrew_srv_01": 2}
+_SRV_VESSELS: frozenset[str] = frozenset(_SRV_CAPACITY)
+
+# Journal events that tell us which vessel we're in, or that end a mission
+_SHIP_EVENTS: frozenset[str] = frozenset({"LoadGame", "Loadout"})
+_VESSEL_EVENTS: frozenset[str] = _SHIP_EVENTS | {"LaunchSRV"}
+_MISSION_END_EVENTS: frozenset[str] = frozenset(
+    {"MissionAbandoned", "MissionCompleted", "MissionFailed"}
+)
+
+# Every journal event that journal_entry() acts on; everything else is ignored
+_INTERESTING_EVENTS: frozenset[str] = (
+    _VESSEL_EVENTS
+    | _MISSION_END_EVENTS
+    | {
+        "ShutDown",
+        "StartUp",
+        "Resurrect",
+        "Cargo",
+        "Missions",
+        "MissionAccepted",
+        "CargoDepot",
+    }
+)
+
+
+# The (count, symbol, name) labels making up one row of a manifest frame
+ManifestRow = Tuple[tk.Label, tk.Label, tk.Label]
+LABEL_KW: Dict[str, Any] = {"pady": 0, "borderwidth": 0, "highlightthickness": 0}
+
 
 class CargoItem(TypedDict):
     Name: Required[str]
@@ -43,6 +93,81 @@ class Mission(TypedDict):
     stolen: bool
 
 
+class MissionSlot:
+    """Cargo allocated to a single mission within a manifest entry."""
+
+    __slots__ = ("count", "stolen", "count_need", "stolen_need", "allocated")
+
+    def __init__(self, count: int = 0, stolen: int = 0, allocated: bool = False):
+        self.count = count
+        self.stolen = stolen
+        self.count_need: Optional[int] = None
+        self.stolen_need: Optional[int] = None
+        self.allocated = allocated
+
+    def __repr__(self) -> str:
+        return (
+            f"MissionSlot(count={self.count}, stolen={self.stolen}, "
+            f"count_need={self.count_need}, stolen_need={self.stolen_need}, "
+            f"allocated={self.allocated})"
+        )
+
+
+class ManifestEntry:
+    """All the manifest info for a specific commodity."""
+
+    __slots__ = ("name", "count", "stolen", "missions")
+
+    def __init__(self, name: str, count: int = 0, stolen: int = 0):
+        self.name = name
+        self.count = count
+        self.stolen = stolen
+        self.missions: Dict[str, MissionSlot] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"ManifestEntry(name={self.name!r}, count={self.count}, "
+            f"stolen={self.stolen}, missions={self.missions})"
+        )
+
+
+class RowPool:
+    """Reusable label rows, and render caches, for a manifest frame."""
+
+    def __init__(self):
+        self.rows: list[ManifestRow] = []
+        # the text currently shown by each row's labels
+        self.texts: list[Tuple[str, str, str]] = []
+        # rows[:visible] are currently gridded
+        self.visible: int = 0
+        # rows[:themed] have had the EDMC theme applied
+        self.themed: int = 0
+        # signature of the data last rendered, and what populate_manifest returned
+        self.last_sig: Optional[tuple] = None
+        self.last_result: Tuple[bool, int] = (False, 0)
+        # the (commodity, display name) pairs last sorted, in manifest order, and
+        # their sorted order
+        self.sort_names: tuple = ()
+        self.sort_order: list[str] = []
+
+    def hide_from(self, start: int):
+        """Hide the rows from `start` onwards."""
+        for labels in self.rows[start : self.visible]:
+            for label in labels:
+                label.grid_remove()
+        self.visible = min(self.visible, start)
+
+    def clear(self):
+        self.rows.clear()
+        self.texts.clear()
+        self.visible = 0
+        self.themed = 0
+        self.last_sig = None
+        self.last_result = (False, 0)
+        self.sort_names = ()
+        self.sort_order = []
+
+
 class This:
     """Holds module globals."""
 
@@ -50,13 +175,32 @@ class This:
         self.parent: tk.Tk
         self.ui: tk.Frame
 
+        # Where the game writes Cargo.json etc; set from config at plugin start
+        self._journal_dir: pathlib.Path
+
         self.ui_ship_info: tk.Label
         self.ui_ship_info_text: tk.StringVar = tk.StringVar()
         self.ui_ship_manifest: tk.Frame
+        self.ui_ship_rows: RowPool = RowPool()
 
         self.ui_srv_info: tk.Label
         self.ui_srv_info_text: tk.StringVar = tk.StringVar()
         self.ui_srv_manifest: tk.Frame
+        self.ui_srv_rows: RowPool = RowPool()
+
+        # The commodity CSV doesn't change during a session, so only load it once
+        self._rare_loaded: bool = False
+        # (mtime, size) of the rare commodity CSV that RARE_COMMODITY came from
+        self._rare_commodity_key: Optional[Tuple[int, int]] = None
+
+        # Last value written to each StringVar, keyed by Tcl variable name
+        self._strvar_cache: Dict[str, str] = {}
+
+        # Whether each top-level widget is currently gridded, keyed by widget path
+        self._visible: Dict[str, bool] = {}
+
+        # Pending after_idle() id for a coalesced update_gui()
+        self._update_pending: Optional[str] = None
 
         self.reset()
 
@@ -73,6 +217,9 @@ class This:
 
         self.missions: Dict[str, Mission] = {}
 
+        # Snapshot of everything update_gui() renders, to skip no-op redraws
+        self._last_render_sig: tuple = ()
+
     def save_missions(self):
         mission_file = get_local_file("missions.json", False)
         if mission_file:
@@ -127,6 +274,15 @@ def plugin_start3(plugin_dir: str) -> str:
     if not get_local_file(".git"):
         logger.setLevel(logging.INFO)
 
+    update_journal_dir()
+
+    # Preload so the first render already knows about rare commodities. EDMC
+    # may still refresh the CSV after this, so the first LoadGame re-checks it.
+    try:
+        load_commodity_csv()
+    except Exception as e:
+        logger.error(f"Failed to preload commodity CSV: {e}")
+
     return plugin_name
 
 
@@ -163,6 +319,17 @@ def plugin_app(parent: tk.Tk) -> Optional[tk.Frame]:
     return this.ui
 
 
+def prefs_changed(cmdr: Optional[str], is_beta: bool) -> None:
+    """
+    Handle the user saving EDMC settings.
+
+    :param cmdr: Name of Commander.
+    :param is_beta: Whether game beta was detected.
+    """
+    # The journal directory may have been changed
+    update_journal_dir()
+
+
 def journal_entry(
     cmdr: str,
     is_beta: bool,
@@ -183,33 +350,41 @@ def journal_entry(
     :return: None if no error, else an error string.
     """
     event = entry["event"]
-    #logger.debug(f"Journal entry received: {entry}")
+    if event not in _INTERESTING_EVENTS:
+        return None
+    #logger.debug("Journal entry received: %s", entry)
 
     data_has_changed = False
 
     # Manage the state of the GUI
-    if event == "ShutDown":
-        # Cleanup the GUI when quitting the game.
-        # Note: The game sends 'Shutdown' for a clean quit, where EDMC will always
-        # send a 'ShutDown' when it detects any type of quit.
-        this.reset()
-        cleanup_gui()
-        return None
-    elif event in ["LoadGame", "StartUp"]:
-        # Make sure GUI is set up at game start
-        load_commodity_csv()
-        setup_gui()
-        this.load_missions()
-    elif event == "Resurrect":
-        # Reset cargo tracking on resurrection
-        this.reset()
-        this.save_missions()
-        data_has_changed = True
+    match event:
+        case "ShutDown":
+            # Cleanup the GUI when quitting the game.
+            # Note: The game sends 'Shutdown' for a clean quit, where EDMC will always
+            # send a 'ShutDown' when it detects any type of quit.
+            this.reset()
+            if this._update_pending is not None:
+                this.parent.after_cancel(this._update_pending)
+                this._update_pending = None
+            cleanup_gui()
+            return None
+        case "LoadGame" | "StartUp":
+            # Make sure GUI is set up at game start
+            if not this._rare_loaded:
+                load_commodity_csv()
+                this._rare_loaded = True
+            setup_gui()
+            this.load_missions()
+        case "Resurrect":
+            # Reset cargo tracking on resurrection
+            this.reset()
+            this.save_missions()
+            data_has_changed = True
 
     # Track the current vessel (ship/SRV) that we're in, so we can use it
     # to track cargo later and figure out the cargo capacity.
-    if event in ["LoadGame", "Loadout", "LaunchSRV"]:
-        if event in ["LoadGame", "Loadout"]:
+    if event in _VESSEL_EVENTS:
+        if event in _SHIP_EVENTS:
             this.current_vessel = canonicalise(entry.get("Ship", ""))
         elif event == "LaunchSRV":
             this.current_vessel = canonicalise(entry.get("SRVType", ""))
@@ -253,7 +428,7 @@ def journal_entry(
     # Note that not all events will include StolenGoods tag, so YMMV...
     # (e.g. did the cmdr transfer a stolen or not-stolen item? no clue)
 
-    if event in "Cargo":
+    if event == "Cargo":
         match entry.get("Vessel"):
             case "Ship":
                 this.ship_cargo = entry if "Inventory" in entry else state["CargoJSON"]
@@ -303,7 +478,7 @@ def journal_entry(
         if add_mission(entry):
             data_has_changed = True
             this.save_missions()
-    elif event in ["MissionAbandoned", "MissionCompleted", "MissionFailed"]:
+    elif event in _MISSION_END_EVENTS:
         # Rely on a Cargo event to update cargo state, so just stop tracking this mission
         if str(entry["MissionID"]) in this.missions:
             del this.missions[str(entry["MissionID"])]
@@ -330,33 +505,54 @@ def journal_entry(
         this.save_missions()
 
     if data_has_changed:
-        update_gui()
+        schedule_update()
 
     return None
 
 
 def populate_manifest(
-    manifest_frame: tk.Frame, cargo: Dict[str, Any], missions: Dict[str, Mission] = {}
+    manifest_frame: tk.Frame,
+    row_pool: RowPool,
+    data_sig: tuple,
+    cargo: Dict[str, Any],
+    missions: Dict[str, Mission] = {},
 ) -> Tuple[bool, int]:
-    """Populate the cargo manifest UI with the current cargo data."""
-    for widget in manifest_frame.winfo_children():
-        widget.destroy()
+    """
+    Populate the cargo manifest UI with the current cargo data.
+
+    Labels are reused across calls via `row_pool`, rather than recreated, and
+    the frame is left alone if `data_sig` (the caller's signature of `cargo`
+    and `missions`) matches the last render.
+    """
+    sig = (data_sig, len(RARE_COMMODITY))
+    if sig == row_pool.last_sig:
+        return row_pool.last_result
+    row_pool.last_sig = sig
 
     if not cargo or "Inventory" not in cargo:
-        return False, 0
+        row_pool.hide_from(0)
+        row_pool.last_result = (False, 0)
+        return row_pool.last_result
 
     total = 0
-    manifest = {}
+    manifest: Dict[str, ManifestEntry] = {}
 
     # collate all the items into a single manifest
+    # (globals are bound to locals, as this loop runs for every inventory item)
+    _canonicalise = canonicalise
+    _rare_commodity = RARE_COMMODITY
+    _manifest_get = manifest.get
     inventory: list[CargoItem] = cargo.get("Inventory", [])
     for item in inventory:
-        total += item["Count"]
-
-        name = canonicalise(item["Name"])
-        if name in manifest:
-            manifest[name]["count"] += item["Count"] - item["Stolen"]
-            manifest[name]["stolen"] += item["Stolen"]
+        count = item["Count"]
+        stolen = item["Stolen"]
+        total += count
+
+        name = _canonicalise(item["Name"])
+        entry = _manifest_get(name)
+        if entry is not None:
+            entry.count += count - stolen
+            entry.stolen += stolen
         else:
             # sometimes Cargo isn't localized, but the mission is, so search there...
             display = None
@@ -368,72 +564,48 @@ def populate_manifest(
                         display = mission["name_localised"]
                         break
             if display is None:
-                display = item["Name"].title()
+                display = _display_cache.get(item["Name"])
+                if display is None:
+                    display = _display_cache[item["Name"]] = item["Name"].title()
 
             # give rare commodities a special flair so it's more visible
-            if name in RARE_COMMODITY:
+            if name in _rare_commodity:
                 display += " ⚜️"
 
-            # manifest entry holds all info for a specific commodity
-            manifest[name] = {
-                "name": display,
-                "count": item["Count"] - item["Stolen"],
-                "stolen": item["Stolen"],
-                "missions": {},
-            }
+            entry = manifest[name] = ManifestEntry(display, count - stolen, stolen)
 
         # If this specific inventory item has a mission associated, make sure to allocate it
         if "MissionID" in item:
-            manifest[name]["missions"][str(item["MissionID"])] = {
-                "count": item["Count"] - item["Stolen"],
-                "stolen": item["Stolen"],
-                "count_need": None,
-                "stolen_need": None,
-                "allocated": True,
-            }
-            manifest[name]["count"] -= item["Count"] - item["Stolen"]
-            manifest[name]["stolen"] -= item["Stolen"]
+            entry.missions[str(item["MissionID"])] = MissionSlot(
+                count - stolen, stolen, allocated=True
+            )
+            entry.count -= count - stolen
+            entry.stolen -= stolen
 
     # go through all of the known missions and attach them to the corresponding Cargo
     for mission_id, mission in missions.items():
-        if mission["name"] not in manifest:
-            manifest[mission["name"]] = {
-                "name": mission["name_localised"],
-                "count": 0,
-                "stolen": 0,
-                "missions": {},
-            }
-        if mission_id not in manifest[mission["name"]]["missions"]:
-            manifest[mission["name"]]["missions"][mission_id] = {
-                "count": 0,
-                "stolen": 0,
-                "count_need": None,
-                "stolen_need": None,
-                "allocated": False,
-            }
-        record = manifest[mission["name"]]["missions"][mission_id]
-
-        record["allocated"] = mission["allocated"]
+        entry = manifest.get(mission["name"])
+        if entry is None:
+            entry = manifest[mission["name"]] = ManifestEntry(mission["name_localised"])
+        record = entry.missions.get(mission_id)
+        if record is None:
+            record = entry.missions[mission_id] = MissionSlot()
+
+        record.allocated = mission["allocated"]
 
         if mission["stolen"]:
-            record["stolen_need"] = mission["remaining"]
+            record.stolen_need = mission["remaining"]
         else:
-            record["count_need"] = mission["remaining"]
+            record.count_need = mission["remaining"]
 
-        if manifest[mission["name"]]["count"] > 0 and record["count_need"]:
-            allocate = min(
-                manifest[mission["name"]]["count"],
-                record["count_need"],
-            )
-            manifest[mission["name"]]["count"] -= allocate
-            record["count"] = allocate
-        if manifest[mission["name"]]["stolen"] > 0 and record["stolen_need"]:
-            allocate = min(
-                manifest[mission["name"]]["stolen"],
-                record["stolen_need"],
-            )
-            manifest[mission["name"]]["stolen"] -= allocate
-            record["stolen"] = allocate
+        if entry.count > 0 and record.count_need:
+            allocate = min(entry.count, record.count_need)
+            entry.count -= allocate
+            record.count = allocate
+        if entry.stolen > 0 and record.stolen_need:
+            allocate = min(entry.stolen, record.stolen_need)
+            entry.stolen -= allocate
+            record.stolen = allocate
 
     if missions:
         logger.debug(manifest)
@@ -442,84 +614,165 @@ def populate_manifest(
 
     def make_label(count: int, symbol: str, name: str, suffix: str = ""):
         nonlocal row
-        display = f"{name} [{suffix}]" if suffix else name
-        tk.Label(
-            manifest_frame,
-            text=f"{count}",
-            pady=0,
-            borderwidth=0,
-            highlightthickness=0,
-        ).grid(row=row, column=0, sticky=tk.E)
-        tk.Label(
-            manifest_frame, text=symbol, pady=0, borderwidth=0, highlightthickness=0
-        ).grid(row=row, column=1, padx=2)
-        tk.Label(
-            manifest_frame,
-            text=display,
-            pady=0,
-            borderwidth=0,
-            highlightthickness=0,
-        ).grid(row=row, column=2, sticky=tk.W)
+        texts = (f"{count}", symbol, f"{name} [{suffix}]" if suffix else name)
+        if row < len(row_pool.rows):
+            labels = row_pool.rows[row]
+            # only touch the labels whose text actually changed
+            for label, old, new in zip(labels, row_pool.texts[row], texts):
+                if old != new:
+                    label.config(text=new)
+            row_pool.texts[row] = texts
+            count_label, symbol_label, name_label = labels
+        else:
+            count_label, symbol_label, name_label = (
+                tk.Label(manifest_frame, text=text, **LABEL_KW) for text in texts
+            )
+            row_pool.rows.append((count_label, symbol_label, name_label))
+            row_pool.texts.append(texts)
+        # Rows always sit at their pool index, so visible rows don't need regridding
+        if row >= row_pool.visible:
+            count_label.grid(row=row, column=0, sticky=tk.E)
+            symbol_label.grid(row=row, column=1, padx=2)
+            name_label.grid(row=row, column=2, sticky=tk.W)
         row += 1
 
-    # populate the UI, sorted by name
-    for item in sorted(manifest.values(), key=lambda x: x["name"]):
+    # populate the UI, sorted by name (the commodities rarely change, so reuse
+    # the previous order if we can). The key keeps the manifest order, not just
+    # the set, so that entries sharing a display name keep the stable sort's
+    # ordering.
+    names = tuple((key, entry.name) for key, entry in manifest.items())
+    if names != row_pool.sort_names:
+        row_pool.sort_names = names
+        row_pool.sort_order = sorted(manifest, key=lambda key: manifest[key].name)
+    order = row_pool.sort_order
+
+    for key in order:
+        item = manifest[key]
+        item_name = item.name
+
         # show mission details first
         mission_count = 0
         mission_stolen = 0
-        for mission in item["missions"].values():
-            mission_count += mission["count"]
-            mission_stolen += mission["stolen"]
-            if mission["count_need"] is not None:
+        for mission in item.missions.values():
+            mission_count += mission.count
+            mission_stolen += mission.stolen
+            symbol = "🛡️" if not mission.allocated else "🔗"
+            if mission.count_need is not None:
+                make_label(mission.count, symbol, item_name, f"{mission.count_need}")
+            elif mission.count > 0:
+                make_label(mission.count, symbol, item_name, "#?")
+            if mission.stolen_need is not None:
                 make_label(
-                    mission["count"],
-                    "🛡️" if not mission["allocated"] else "🔗",
-                    item["name"],
-                    f"{mission['count_need']}",
+                    mission.stolen, "📛", item_name, f"need {mission.stolen_need}"
                 )
-            elif mission["count"] > 0:
-                make_label(
-                    mission["count"],
-                    "🛡️" if not mission["allocated"] else "🔗",
-                    item["name"],
-                    "#?",
-                )
-            if mission["stolen_need"] is not None:
-                make_label(
-                    mission["stolen"],
-                    "📛",
-                    item["name"],
-                    f"need {mission['stolen_need']}",
-                )
-            elif mission["stolen"] > 0:
-                make_label(mission["stolen"], "📛", item["name"], "#?")
+            elif mission.stolen > 0:
+                make_label(mission.stolen, "📛", item_name, "#?")
 
         # finally show what's remaining
-        if item["count"] > 0:
-            make_label(item["count"], "–", item["name"])
-        if item["stolen"] > 0:
-            make_label(item["stolen"], "⚠️", item["name"])
+        if item.count > 0:
+            make_label(item.count, "–", item_name)
+        if item.stolen > 0:
+            make_label(item.stolen, "⚠️", item_name)
 
-    return row > 0, total
+    row_pool.hide_from(row)
+    row_pool.visible = row
+
+    row_pool.last_result = (row > 0, total)
+    return row_pool.last_result
+
+
+def cargo_sig(cargo: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """Summarise the rendered parts of a Cargo event for change detection."""
+    if not cargo or "Inventory" not in cargo:
+        return None
+    return tuple(
+        (
+            item["Name"],
+            item.get("Name_Localised"),
+            item["Count"],
+            item["Stolen"],
+            item.get("MissionID"),
+        )
+        for item in cargo["Inventory"]
+    )
+
+
+def missions_sig(missions: Dict[str, Mission]) -> tuple:
+    """Summarise the rendered parts of the tracked missions for change detection."""
+    return tuple(
+        (
+            mission_id,
+            mission["name"],
+            mission["name_localised"],
+            mission["remaining"],
+            mission["allocated"],
+            mission["stolen"],
+        )
+        for mission_id, mission in missions.items()
+    )
+
+
+def schedule_update():
+    """
+    Redraw the GUI once Tk is idle.
+
+    EDMC delivers bursts of events (e.g. LoadGame, Cargo, Missions at startup),
+    so this coalesces them into a single update_gui().
+    """
+    if this._update_pending is None:
+        this._update_pending = this.parent.after_idle(flush_update)
+
+
+def flush_update():
+    this._update_pending = None
+    update_gui()
+
+
+def render_sig(
+    ship_sig: Optional[tuple], mission_sig: tuple, srv_sig: Optional[tuple]
+) -> tuple:
+    """Combine the data signatures with the rest of the state update_gui() shows."""
+    # (the SRV manifest is hidden while in the ship, so its changes don't matter)
+    return (
+        ship_sig,
+        mission_sig,
+        this.ship_capacity,
+        this.ship_capacity_guessed,
+        this.current_vessel_is_srv,
+        (srv_sig, this.srv_capacity) if this.current_vessel_is_srv else None,
+        len(RARE_COMMODITY),
+    )
 
 
 def update_gui():
+    # Many events leave the manifest as-is, so don't redraw if nothing changed
+    ship_sig = cargo_sig(this.ship_cargo)
+    mission_sig = missions_sig(this.missions)
+    srv_sig = cargo_sig(this.srv_cargo) if this.current_vessel_is_srv else None
+    if render_sig(ship_sig, mission_sig, srv_sig) == this._last_render_sig:
+        return
+
     has_rows = False
 
     ship_has_rows = False
     ship_occupied = 0
-    if this.ship_cargo is None:
-        this.ui_ship_manifest.grid_remove()
+    if not this.ship_cargo or "Inventory" not in this.ship_cargo:
+        # Nothing to list, so don't bother walking the missions
+        set_visible(this.ui_ship_manifest, False)
     else:
         ship_has_rows, ship_occupied = populate_manifest(
-            this.ui_ship_manifest, this.ship_cargo, this.missions
+            this.ui_ship_manifest,
+            this.ui_ship_rows,
+            (ship_sig, mission_sig),
+            this.ship_cargo,
+            this.missions,
         )
         if ship_has_rows:
-            this.ui_ship_manifest.grid()
-            theme.update(this.ui_ship_manifest)
+            set_visible(this.ui_ship_manifest, True)
+            theme_new_rows(this.ui_ship_manifest, this.ui_ship_rows)
             has_rows = True
         else:
-            this.ui_ship_manifest.grid_remove()
+            set_visible(this.ui_ship_manifest, False)
 
     if this.ship_capacity_guessed:
         if this.ship_capacity < ship_occupied:
@@ -529,48 +782,52 @@ def update_gui():
         this.ship_capacity_guessed = True
 
     if this.ship_capacity == 0 and not ship_has_rows:
-        this.ui_ship_info.grid_remove()
+        set_visible(this.ui_ship_info, False)
     else:
         capacity = this.ship_capacity
         remaining = capacity - ship_occupied
         marker = "?" if this.ship_capacity_guessed else ""
-        this.ui_ship_info_text.set(
-            f"Ship Manifest: {ship_occupied} / {capacity}{marker} [{remaining}]"
+        set_text(
+            this.ui_ship_info_text,
+            f"Ship Manifest: {ship_occupied} / {capacity}{marker} [{remaining}]",
         )
-        this.ui_ship_info.grid()
+        set_visible(this.ui_ship_info, True)
         has_rows = True
 
     if not this.current_vessel_is_srv:
-        this.ui_srv_info.grid_remove()
-        this.ui_srv_manifest.grid_remove()
+        set_visible(this.ui_srv_info, False)
+        set_visible(this.ui_srv_manifest, False)
     else:
         srv_has_rows = False
         srv_occupied = 0
         if this.srv_capacity is None:
-            this.ui_srv_manifest.grid_remove()
+            set_visible(this.ui_srv_manifest, False)
         else:
             srv_has_rows, srv_occupied = populate_manifest(
-                this.ui_srv_manifest, this.srv_cargo
+                this.ui_srv_manifest, this.ui_srv_rows, (srv_sig,), this.srv_cargo
             )
             if srv_has_rows:
-                this.ui_srv_manifest.grid()
-                theme.update(this.ui_srv_manifest)
+                set_visible(this.ui_srv_manifest, True)
+                theme_new_rows(this.ui_srv_manifest, this.ui_srv_rows)
                 has_rows = True
             else:
-                this.ui_srv_manifest.grid_remove()
+                set_visible(this.ui_srv_manifest, False)
 
         if this.srv_capacity is None and not srv_has_rows:
-            this.ui_srv_info.grid_remove()
+            set_visible(this.ui_srv_info, False)
         else:
             if this.srv_capacity is None:
-                this.ui_srv_info_text.set(f"SRV Manifest: {srv_occupied} / ???")
+                set_text(
+                    this.ui_srv_info_text, f"SRV Manifest: {srv_occupied} / ???"
+                )
             else:
                 capacity = this.srv_capacity
                 remaining = this.srv_capacity - srv_occupied
-                this.ui_srv_info_text.set(
-                    f"SRV Manifest: {srv_occupied} / {capacity} [{remaining}]"
+                set_text(
+                    this.ui_srv_info_text,
+                    f"SRV Manifest: {srv_occupied} / {capacity} [{remaining}]",
                 )
-            this.ui_srv_info.grid()
+            set_visible(this.ui_srv_info, True)
             has_rows = True
 
     # If we're showing no details, show a placeholder
@@ -581,8 +838,40 @@ def update_gui():
             capacity = "None"
         else:
             capacity = this.ship_capacity
-        this.ui_ship_info_text.set(f"Ship Capacity: {capacity}")
-        this.ui_ship_info.grid()
+        set_text(this.ui_ship_info_text, f"Ship Capacity: {capacity}")
+        set_visible(this.ui_ship_info, True)
+
+    # Record what was drawn, including any capacity guess adjusted above
+    this._last_render_sig = render_sig(ship_sig, mission_sig, srv_sig)
+
+
+def theme_new_rows(manifest_frame: tk.Frame, row_pool: RowPool):
+    """
+    Apply the EDMC theme to a manifest frame if it has new labels.
+
+    theme.update() walks every child, but reused labels keep their theme (EDMC
+    re-themes registered widgets itself), so only do it when the pool grows.
+    """
+    if row_pool.themed < len(row_pool.rows):
+        theme.update(manifest_frame)
+        row_pool.themed = len(row_pool.rows)
+
+
+def set_visible(widget: tk.Widget, visible: bool):
+    """Show or hide a widget, only touching the grid manager on a change."""
+    if this._visible.get(str(widget), False) != visible:
+        if visible:
+            widget.grid()
+        else:
+            widget.grid_remove()
+        this._visible[str(widget)] = visible
+
+
+def set_text(var: tk.StringVar, value: str):
+    """Set a StringVar, skipping the Tcl trace and redraw if it's unchanged."""
+    if this._strvar_cache.get(str(var)) != value:
+        var.set(value)
+        this._strvar_cache[str(var)] = value
 
 
 def setup_gui():
@@ -591,19 +880,21 @@ def setup_gui():
 
 
 def cleanup_gui():
-    this.ui_ship_info.grid_remove()
-    this.ui_ship_manifest.grid_remove()
+    set_visible(this.ui_ship_info, False)
+    set_visible(this.ui_ship_manifest, False)
 
-    this.ui_srv_info.grid_remove()
-    this.ui_srv_manifest.grid_remove()
+    set_visible(this.ui_srv_info, False)
+    set_visible(this.ui_srv_manifest, False)
 
-    this.ui_ship_info_text.set("")
+    set_text(this.ui_ship_info_text, "")
     for widget in this.ui_ship_manifest.winfo_children():
         widget.destroy()
+    this.ui_ship_rows.clear()
 
-    this.ui_srv_info_text.set("")
+    set_text(this.ui_srv_info_text, "")
     for widget in this.ui_srv_manifest.winfo_children():
         widget.destroy()
+    this.ui_srv_rows.clear()
 
 
 def load_commodity_csv():
@@ -613,13 +904,13 @@ def load_commodity_csv():
     def get_file(filename: str) -> Optional[pathlib.Path]:
         try:
             commodityfile = config.app_dir_path / "FDevIDs" / filename
-            if pathlib.Path.is_file(commodityfile):
+            if commodityfile.is_file():
                 return commodityfile
         except FileNotFoundError:
             pass
 
         commodityfile = pathlib.Path(f"FDevIDs/{filename}")
-        if pathlib.Path.is_file(commodityfile):
+        if commodityfile.is_file():
             return commodityfile
 
         return None
@@ -628,43 +919,96 @@ def load_commodity_csv():
     # plugin_start().
     commodityfile = get_file("rare_commodity.csv")
     if commodityfile:
+        import pickle
+
+        stat = commodityfile.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if key == this._rare_commodity_key:
+            # e.g. preloaded at plugin start, and FDevIDs wasn't updated since
+            return
+
+        cache_file = get_local_file(RARE_COMMODITY_CACHE)
+        if cache_file:
+            try:
+                with open(cache_file, "rb") as f:
+                    cached_key, cached_symbols = pickle.load(f)
+                if cached_key == key:
+                    RARE_COMMODITY.clear()
+                    RARE_COMMODITY.update(cached_symbols)
+                    this._rare_commodity_key = key
+                    return
+            except Exception as e:
+                logger.debug(f"Ignoring rare commodity cache: {e}")
+
+        # Only needed when the cache is stale, so don't import it up front
+        import csv
+
         RARE_COMMODITY.clear()
         with open(commodityfile, newline="", encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                symbol = row.get("symbol")
-                if symbol:
-                    RARE_COMMODITY.add(canonicalise(symbol))
+            reader = csv.reader(csvfile)
+            try:
+                index = next(reader).index("symbol")
+            except (StopIteration, ValueError):
+                logger.error(f"No symbol column in {commodityfile}")
+                return
+            RARE_COMMODITY.update(
+                canonicalise(row[index])
+                for row in reader
+                if len(row) > index and row[index]
+            )
+        this._rare_commodity_key = key
 
+        # Write to a temporary file first, so a partial write is never loaded
+        cache_file = get_local_file(RARE_COMMODITY_CACHE, False)
+        if cache_file:
+            tmp_file = cache_file.with_suffix(".tmp")
+            try:
+                with open(tmp_file, "wb") as f:
+                    pickle.dump((key, RARE_COMMODITY), f)
+                os.replace(tmp_file, cache_file)
+            except Exception as e:
+                logger.error(f"Failed to save rare commodity cache: {e}")
 
+
+@lru_cache(maxsize=2048)
 def canonicalise(item: str) -> str:
-    """Convert an item name to a canonical form for comparison."""
+    """
+    Convert an item name to a canonical form for comparison.
+
+    Results are memoized; the commodity vocabulary is small, so the cache is
+    bounded at a few hundred KB.
+    """
+    # Plain names (e.g. from Name_Localised) don't have the "$..._name;" wrapper
+    if not item.startswith("$"):
+        return item.lower()
     item = item.lower()
-    match = CANONICALISE_RE.match(item)
-    return match.group(1) if match else item
+    # Strip the wrapper, which needs at least one inner character
+    if len(item) > 7 and item.endswith("_name;"):
+        return item[1:-6]
+    return item
 
 
 def is_srv(vessel: str) -> bool:
-    return vessel in ["testbuggy", "combat_multicrew_srv_01"]
+    return vessel in _SRV_VESSELS
 
 
 def get_srv_capacity(vessel: str) -> Optional[int]:
-    match vessel:
-        case "testbuggy":
-            return 4
-        case "combat_multicrew_srv_01":
-            return 2
-        case _:
-            return None
+    return _SRV_CAPACITY.get(vessel)
 
 
-def load_json(item: str) -> Optional[dict]:
+def update_journal_dir():
     journaldir = config.get_str("journaldir") or config.default_journal_dir
-    filepath = pathlib.Path(journaldir) / f"{item}.json"
+    this._journal_dir = pathlib.Path(journaldir)
+
+
+def load_json(item: str) -> Optional[dict]:
+    filepath = this._journal_dir / f"{item}.json"
+    # A missing file is routine (e.g. no Cargo.json yet), so don't raise for it
+    if not filepath.is_file():
+        return None
     try:
-        with filepath.open("rb") as f:
-            return json.load(f)
-    except:
+        return json_loads(filepath.read_bytes())
+    except (OSError, ValueError, JSONDecodeError):
         return None
 
 